@@ -4,21 +4,79 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import Dict, Optional, Sequence, Tuple, Union
+from functools import lru_cache
+from tokenize import TokenError
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 import sympy as sp
+from sympy.parsing.sympy_parser import parse_expr, standard_transformations
 
 __all__ = ["CalculatorError", "AdvancedCalculator", "GeometryCalculation"]
 
+# Configure SymPy once at import to avoid Unicode heavy output so CLI
+# rendering stays clean; doing it per calculator instance rebinds the hooks.
+sp.init_printing(use_unicode=False)
+
 Sympifyable = Union[str, int, float, complex, sp.Expr]
 # Convenience alias for values the calculator can safely pass to ``sympify``.
 
+# The calculator accepts copy/pasted expressions from various encodings.
+# The translation table captures the most common stray glyphs and maps them
+# back to arithmetic symbols before handing the string to SymPy.
+_GLYPH_TRANSLATION = str.maketrans(
+    {
+        "×": "*",
+        "·": "*",
+        "∙": "*",
+        "÷": "/",
+        "−": "-",
+        "–": "-",
+        "—": "-",
+        "√": "sqrt",
+        "π": "pi",
+        "∞": "oo",
+        # ``sympify`` drops newlines from pasted multi-line input; so do we.
+        "\n": None,
+    }
+)
+# A lone caret means exponentiation; ``**`` is left untouched.
+_CARET_RE = re.compile(r"(?<!\*)\^(?!\*)")
+
+# SymPy names used on hot paths, bound once to skip repeated attribute lookups.
+_COMPLEXES = sp.S.Complexes
+_ConditionSet = sp.ConditionSet
+_Eq = sp.Eq
+_sympify_sp = sp.sympify
+_solveset = sp.solveset
+# Expressions containing these may bind a variable that must not be replaced.
+_BINDING_CONSTRUCTS = (sp.Integral, sp.Sum, sp.Product, sp.Subs, sp.Lambda, sp.Derivative)
+
+# Same transformations ``sympify`` applies to strings. Implicit multiplication
+# is deliberately absent: it would turn calls such as ``f(x)`` into ``f*x``.
+_TRANSFORMS = standard_transformations
+# Sums with at least this many top-level terms are parsed term by term and
+# combined with a single ``Add``; SymPy's pairwise ``+`` re-flattens the
+# growing sum on every step, which is quadratic in the number of terms.
+_FLAT_SUM_THRESHOLD = 16
+# Scientific-notation prefix such as ``1e`` or ``2.5E`` whose sign must not
+# be treated as a binary operator.
+_FLOAT_EXPONENT_RE = re.compile(r"(?:\d+\.?\d*|\.\d+)[eE]")
+# Operators that bind looser than ``+``/``-`` (shifts, bitwise, comparisons,
+# tuples, conditionals, lambdas); splitting the sum around them would regroup
+# the operands, so such inputs are always parsed as a whole.
+_LOOSE_BINDING_RE = re.compile(
+    r"<|>|=|&|\||\^|,|:|\b(?:if|else|lambda|and|or|not|in|is)\b"
+)
+
+# SymPy uses '+', '-', or '+-' to express the direction of approach.
+_DIRECTION_MAP = {"both": "+-", "plus": "+", "minus": "-"}
+
 
 class CalculatorError(Exception):
     """Raised when the calculator cannot finish an operation."""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GeometryCalculation:
     """Collects the result of a geometry helper."""
 
@@ -29,50 +87,152 @@ class GeometryCalculation:
         return f"{self.name}: {self.value}"
 
 
+@lru_cache(maxsize=1024)
+def _normalize_expression(expression: str) -> str:
+    """Return a sanitized expression string that SymPy can parse.
+
+    Results are memoized because the CLI and tests keep re-normalizing the
+    same short inputs (root degrees, repeated expressions).
+    """
+    # A single ``translate`` pass handles every glyph, including the ones that
+    # expand into multi-character names.
+    expression = expression.translate(_GLYPH_TRANSLATION)
+    expression = _CARET_RE.sub("**", expression)
+    return expression
+
+
+def _ends_operand(char: str) -> bool:
+    """Return whether ``char`` can close an operand, making a following sign binary."""
+    return bool(char) and (char.isalnum() or char in ")]}._!")
+
+
+def _split_top_level_sum(expression: str) -> List[str]:
+    """Split ``expression`` at binary ``+``/``-`` outside of any brackets.
+
+    Each returned chunk keeps its leading sign so it parses on its own. Unary
+    signs (``2*-3``, ``x**-1``) and exponent signs (``1e-5``) are not split.
+    """
+    terms: List[str] = []
+    depth = 0
+    start = 0
+    token_start = 0
+    previous = ""
+    for index, char in enumerate(expression):
+        if char in "([{":
+            depth += 1
+        elif char in ")]}":
+            depth -= 1
+        elif char in "+-" and depth == 0 and _ends_operand(previous):
+            exponent = previous in "eE" and _FLOAT_EXPONENT_RE.fullmatch(
+                expression, token_start, index
+            )
+            if not exponent:
+                terms.append(expression[start:index])
+                start = index
+        if not (char.isalnum() or char in "._"):
+            token_start = index + 1
+        if not char.isspace():
+            previous = char
+    if depth != 0:
+        # Let the parser report the unbalanced brackets.
+        return [expression]
+    terms.append(expression[start:])
+    return terms
+
+
+def _parse_expression(expression: str) -> sp.Expr:
+    """Parse a normalized expression string into a SymPy expression."""
+    terms = _split_top_level_sum(expression)
+    if len(terms) >= _FLAT_SUM_THRESHOLD and not _LOOSE_BINDING_RE.search(expression):
+        try:
+            parsed = [parse_expr(terms[0], transformations=_TRANSFORMS)]
+            for term in terms[1:]:
+                # Parse the body without its sign and negate afterwards, so a
+                # chunk such as "- 7 % 3" keeps meaning -(7 % 3).
+                body = parse_expr(term[1:], transformations=_TRANSFORMS)
+                if not isinstance(body, sp.Expr):
+                    break
+                parsed.append(-body if term[0] == "-" else body)
+            else:
+                if isinstance(parsed[0], sp.Expr):
+                    return sp.Add(*parsed)
+        except (SyntaxError, TokenError):
+            pass
+        # Anything the per-term path cannot represent goes through the
+        # whole-string parse below instead.
+    try:
+        return parse_expr(expression, transformations=_TRANSFORMS)
+    except (SyntaxError, TokenError) as exc:
+        # Surface parser failures the same way ``sympify`` does.
+        raise sp.SympifyError(expression, exc) from exc
+
+
+@lru_cache(maxsize=2048, typed=True)
+def _sympify_cached(value: Union[str, int, float]) -> sp.Expr:
+    """Memoized conversion for hashable literals (``typed`` keeps 1, 1.0, True apart)."""
+    if isinstance(value, str):
+        return _parse_expression(value)
+    return _sympify_sp(value)
+
+
+@lru_cache(maxsize=256)
+def _symbol(name: str) -> sp.Symbol:
+    """Return the SymPy symbol for ``name``, skipping the parser on repeats."""
+    return sp.symbols(name)
+
+
+@lru_cache(maxsize=256)
+def _solve_cached(normalized: str, variable: str) -> sp.Set:
+    """Solve a normalized equation over the complex numbers, memoizing the set.
+
+    Solver runs can take seconds, while the CLI and tests keep re-solving the
+    same handful of equations.
+    """
+    symbol = _symbol(variable)
+    if "=" in normalized:
+        # Explicit equality: move both sides into one difference so the
+        # parser runs once instead of once per side.
+        lhs, rhs = normalized.split("=", maxsplit=1)
+        if not lhs.strip() or not rhs.strip():
+            raise ValueError("Both sides of the equation must be provided.")
+        normalized = f"({lhs}) - ({rhs})"
+    # The (possibly rewritten) expression is assumed to equal zero.
+    expr = _Eq(_parse_expression(normalized), 0)
+    return _solveset(expr, symbol, domain=_COMPLEXES)
+
+
+def _maybe_simplify(expr: sp.Expr) -> sp.Expr:
+    """Run ``simplify`` only when the expression can actually be reduced.
+
+    Atomic results (integers, rationals, floats, constants, lone symbols) are
+    already canonical after SymPy's automatic evaluation, so the expensive
+    simplification cascade is skipped for them. Compound constants such as
+    ``log(sqrt(2))/log(2)`` still go through ``simplify``.
+    """
+    if expr.is_Atom:
+        return expr
+    return sp.simplify(expr)
+
+
 class AdvancedCalculator:
     """High-level wrapper combining arithmetic, geometry, limits, and solving."""
 
-    def __init__(self) -> None:
-        # Configure SymPy to avoid Unicode heavy output so CLI rendering stays clean.
-        sp.init_printing(use_unicode=False)
-
     # ------------------------------------------------------------------ #
     # Helpers
 
-    @staticmethod
-    def _normalize_expression(expression: str) -> str:
-        """Return a sanitized expression string that SymPy can parse."""
-        # The calculator accepts copy/pasted expressions from various encodings.
-        # The replacement table captures the most common stray glyphs and maps
-        # them back to arithmetic symbols before handing the string to SymPy.
-        replacements = {
-            "×": "*",
-            "·": "*",
-            "∙": "*",
-            "÷": "/",
-            "−": "-",
-            "–": "-",
-            "—": "-",
-            "√": "sqrt",
-            "π": "pi",
-            "∞": "oo",
-        }
-        for original, replacement in replacements.items():
-            expression = expression.replace(original, replacement)
-        expression = re.sub(r"(?<!\*)\^(?!\*)", "**", expression)
-        return expression
-
     @staticmethod
     def _sympify(value: Sympifyable) -> sp.Expr:
         """Convert user-supplied data into a SymPy expression safely."""
         if isinstance(value, str):
-            value = AdvancedCalculator._normalize_expression(value)
-        return sp.sympify(value)
+            return _sympify_cached(_normalize_expression(value))
+        if isinstance(value, (int, float)):
+            return _sympify_cached(value)
+        return _sympify_sp(value)
 
     @staticmethod
     def _sympify_sequence(values: Sequence[Sympifyable]) -> Tuple[sp.Expr, ...]:
         """Vectorised helper that sympifies every element in a sequence."""
-        return tuple(sp.sympify(item) for item in values)
+        return tuple(AdvancedCalculator._sympify(item) for item in values)
 
     # ------------------------------------------------------------------ #
     # Arithmetic
@@ -80,21 +240,21 @@ class AdvancedCalculator:
     def add(self, a: Sympifyable, b: Sympifyable) -> sp.Expr:
         """Return the simplified sum of two operands."""
         try:
-            return sp.simplify(self._sympify(a) + self._sympify(b))
+            return _maybe_simplify(self._sympify(a) + self._sympify(b))
         except (sp.SympifyError, TypeError, ValueError) as exc:
             raise CalculatorError(str(exc)) from exc
 
     def subtract(self, a: Sympifyable, b: Sympifyable) -> sp.Expr:
         """Return the simplified difference of two operands."""
         try:
-            return sp.simplify(self._sympify(a) - self._sympify(b))
+            return _maybe_simplify(self._sympify(a) - self._sympify(b))
         except (sp.SympifyError, TypeError, ValueError) as exc:
             raise CalculatorError(str(exc)) from exc
 
     def multiply(self, a: Sympifyable, b: Sympifyable) -> sp.Expr:
         """Return the simplified product of two operands."""
         try:
-            return sp.simplify(self._sympify(a) * self._sympify(b))
+            return _maybe_simplify(self._sympify(a) * self._sympify(b))
         except (sp.SympifyError, TypeError, ValueError) as exc:
             raise CalculatorError(str(exc)) from exc
 
@@ -104,14 +264,14 @@ class AdvancedCalculator:
             denominator = self._sympify(b)
             if denominator == 0:
                 raise CalculatorError("Division by zero is not allowed.")
-            return sp.simplify(self._sympify(a) / denominator)
+            return _maybe_simplify(self._sympify(a) / denominator)
         except (sp.SympifyError, TypeError, ValueError) as exc:
             raise CalculatorError(str(exc)) from exc
 
     def power(self, base: Sympifyable, exponent: Sympifyable) -> sp.Expr:
         """Return the simplified power expression."""
         try:
-            return sp.simplify(self._sympify(base) ** self._sympify(exponent))
+            return _maybe_simplify(self._sympify(base) ** self._sympify(exponent))
         except (sp.SympifyError, TypeError, ValueError) as exc:
             raise CalculatorError(str(exc)) from exc
 
@@ -124,14 +284,14 @@ class AdvancedCalculator:
                 raise CalculatorError("Root degree must be numeric.")
             if degree_expr == 0:
                 raise CalculatorError("Zero root degree is undefined.")
-            return sp.simplify(radicand ** (sp.Integer(1) / degree_expr))
+            return _maybe_simplify(radicand ** (sp.Integer(1) / degree_expr))
         except (sp.SympifyError, TypeError, ValueError) as exc:
             raise CalculatorError(str(exc)) from exc
 
     def absolute(self, value: Sympifyable) -> sp.Expr:
         """Return the simplified absolute value of the operand."""
         try:
-            return sp.simplify(sp.Abs(self._sympify(value)))
+            return _maybe_simplify(sp.Abs(self._sympify(value)))
         except (sp.SympifyError, TypeError, ValueError) as exc:
             raise CalculatorError(str(exc)) from exc
 
@@ -140,11 +300,11 @@ class AdvancedCalculator:
         try:
             argument = self._sympify(value)
             if base is None:
-                return sp.simplify(sp.log(argument))
+                return _maybe_simplify(sp.log(argument))
             base_expr = self._sympify(base)
             if base_expr in (0, 1):
                 raise CalculatorError("Log base cannot be 0 or 1.")
-            return sp.simplify(sp.log(argument, base_expr))
+            return _maybe_simplify(sp.log(argument, base_expr))
         except (sp.SympifyError, TypeError, ValueError) as exc:
             raise CalculatorError(str(exc)) from exc
 
@@ -166,55 +326,87 @@ class AdvancedCalculator:
             a_sym, b_sym, c_sym = self._sympify_sequence((a, b, c))
             if a_sym == 0:
                 raise CalculatorError("Coefficient a must be non-zero.")
-            # Quadratic formula: compute the discriminant once so SymPy can
-            # simplify nested radicals in the result.
-            discriminant = sp.simplify(b_sym ** 2 - 4 * a_sym * c_sym)
-            sqrt_disc = sp.sqrt(discriminant)
+            # Quadratic formula: compute the discriminant once. For rational
+            # coefficients SymPy's automatic evaluation already distributes
+            # the division into canonical roots.
+            sqrt_disc = sp.sqrt(b_sym ** 2 - 4 * a_sym * c_sym)
             denom = 2 * a_sym
-            return (
-                sp.simplify((-b_sym + sqrt_disc) / denom),
-                sp.simplify((-b_sym - sqrt_disc) / denom),
-            )
+            roots = ((-b_sym + sqrt_disc) / denom, (-b_sym - sqrt_disc) / denom)
+            if all(coefficient.is_Rational for coefficient in (a_sym, b_sym, c_sym)):
+                return roots
+            # Surd or symbolic coefficients leave stray factors such as
+            # sqrt(2)*(-2 + 2*I)/4; ``together`` is a cheap way to cancel them.
+            return sp.together(roots[0]), sp.together(roots[1])
         except (sp.SympifyError, TypeError, ValueError) as exc:
             raise CalculatorError(str(exc)) from exc
 
     # ------------------------------------------------------------------ #
     # Geometry
 
+    # Dispatch table keeps the CLI layer decoupled from the implementation
+    # details; new helpers only need to be registered in this mapping.
+    _GEOMETRY_DISPATCH: Dict[str, str] = {
+        "circle_area": "_circle_area",
+        "circle_circumference": "_circle_circumference",
+        "rectangle_area": "_rectangle_area",
+        "rectangle_perimeter": "_rectangle_perimeter",
+        "triangle_area": "_triangle_area",
+        "triangle_perimeter": "_triangle_perimeter",
+    }
+
     def geometry(self, figure: str, **parameters: Sympifyable) -> GeometryCalculation:
         """Evaluate a geometry helper and return a labeled symbolic result."""
         figure_key = figure.lower()
-        # Dispatch table keeps the CLI layer decoupled from the implementation
-        # details; new helpers only need to be registered in this mapping.
-        dispatch = {
-            "circle_area": self._circle_area,
-            "circle_circumference": self._circle_circumference,
-            "rectangle_area": self._rectangle_area,
-            "rectangle_perimeter": self._rectangle_perimeter,
-            "triangle_area": self._triangle_area,
-            "triangle_perimeter": self._triangle_perimeter,
-        }
-        handler = dispatch.get(figure_key)
-        if handler is None:
+        method_name = self._GEOMETRY_DISPATCH.get(figure_key)
+        if method_name is None:
             raise CalculatorError(
-                "Unknown geometry operation. Available: " + ", ".join(dispatch.keys())
+                "Unknown geometry operation. Available: "
+                + ", ".join(self._GEOMETRY_DISPATCH.keys())
             )
+        handler = getattr(self, method_name)
         try:
             value = handler(**parameters)
         except TypeError as exc:
             raise CalculatorError("Invalid set of parameters for the chosen operation.") from exc
-        return GeometryCalculation(name=figure_key, value=sp.simplify(value))
+        if not value.is_Number:
+            # Surd inputs leave unexpanded products such as
+            # (sqrt(2) - 1)*(sqrt(2) + 1); a cheap expand collapses them.
+            value = sp.expand(value)
+        return GeometryCalculation(name=figure_key, value=value)
 
     def _ensure_positive_number(self, value: sp.Expr, name: str) -> sp.Expr:
         """Validate that ``value`` is a positive real numeric expression."""
+        if isinstance(value, (sp.Rational, sp.Float)):
+            # Finite literals answer positivity directly, without the assumptions
+            # engine; infinities and NaN still take the generic path below.
+            if not value.is_positive:
+                raise CalculatorError(f"{name} must be greater than zero.")
+            return value
         if not value.is_number:
             raise CalculatorError(f"{name} must be numeric.")
-        if value.is_real is False:
+        # Query the assumption system once; ``is_real`` may be None.
+        is_real = value.is_real
+        if is_real is False:
             raise CalculatorError(f"{name} must be real.")
-        if value.is_real and value <= 0:
+        if is_real and value <= 0:
             raise CalculatorError(f"{name} must be greater than zero.")
         return value
 
+    def _validated_triangle(
+        self,
+        side_a: Sympifyable,
+        side_b: Sympifyable,
+        side_c: Sympifyable,
+    ) -> Tuple[sp.Expr, sp.Expr, sp.Expr]:
+        """Sympify three sides and check positivity and the triangle inequality."""
+        sides = self._sympify_sequence((side_a, side_b, side_c))
+        for side, name in zip(sides, ("Side a", "Side b", "Side c")):
+            self._ensure_positive_number(side, name)
+        a, b, c = sides
+        if a + b <= c or a + c <= b or b + c <= a:
+            raise CalculatorError("Triangle inequality is violated.")
+        return a, b, c
+
     def _circle_area(self, radius: Sympifyable) -> sp.Expr:
         """Compute the symbolic area of a circle (πr²)."""
         r = self._ensure_positive_number(self._sympify(radius), "Radius")
@@ -246,14 +438,14 @@ class AdvancedCalculator:
         side_c: Sympifyable,
     ) -> sp.Expr:
         """Compute triangle area using Heron's formula."""
-        a, b, c = self._sympify_sequence((side_a, side_b, side_c))
-        a = self._ensure_positive_number(a, "Side a")
-        b = self._ensure_positive_number(b, "Side b")
-        c = self._ensure_positive_number(c, "Side c")
-        if a + b <= c or a + c <= b or b + c <= a:
-            raise CalculatorError("Triangle inequality is violated.")
-        semi = (a + b + c) / 2
-        return sp.sqrt(semi * (semi - a) * (semi - b) * (semi - c))
+        a, b, c = self._validated_triangle(side_a, side_b, side_c)
+        # 16 * s(s-a)(s-b)(s-c) expanded over the sides keeps integer inputs in
+        # exact integer arithmetic; ``sqrt`` then resolves perfect squares.
+        heron_16 = (a + b + c) * (-a + b + c) * (a - b + c) * (a + b - c)
+        if not heron_16.is_Number:
+            # Surd sides leave an unexpanded product; expanding collapses it.
+            heron_16 = sp.expand(heron_16)
+        return sp.sqrt(heron_16) / 4
 
     def _triangle_perimeter(
         self,
@@ -262,12 +454,7 @@ class AdvancedCalculator:
         side_c: Sympifyable,
     ) -> sp.Expr:
         """Return the perimeter of a triangle after triangle inequality checks."""
-        a, b, c = self._sympify_sequence((side_a, side_b, side_c))
-        a = self._ensure_positive_number(a, "Side a")
-        b = self._ensure_positive_number(b, "Side b")
-        c = self._ensure_positive_number(c, "Side c")
-        if a + b <= c or a + c <= b or b + c <= a:
-            raise CalculatorError("Triangle inequality is violated.")
+        a, b, c = self._validated_triangle(side_a, side_b, side_c)
         return a + b + c
 
     # ------------------------------------------------------------------ #
@@ -281,18 +468,16 @@ class AdvancedCalculator:
         direction: str = "both",
     ) -> sp.Expr:
         """Evaluate a symbolic limit with configurable approach direction."""
-        # SymPy uses '+', '-', or '+-' to express the direction of approach.
-        direction_map = {"both": "+-", "plus": "+", "minus": "-"}
         direction_key = direction.lower()
-        if direction_key not in direction_map:
+        if direction_key not in _DIRECTION_MAP:
             raise CalculatorError("Direction must be one of: both, plus, minus.")
         if not variable:
             raise CalculatorError("Variable must be provided.")
         try:
-            symbol = sp.symbols(variable)
-            expr = sp.sympify(self._normalize_expression(expression))
+            symbol = _symbol(variable)
+            expr = _parse_expression(_normalize_expression(expression))
             point = self._sympify(approaching)
-            return sp.limit(expr, symbol, point, direction_map[direction_key])
+            return sp.limit(expr, symbol, point, _DIRECTION_MAP[direction_key])
         except (sp.SympifyError, ValueError, TypeError) as exc:
             raise CalculatorError(str(exc)) from exc
 
@@ -310,12 +495,21 @@ class AdvancedCalculator:
         helper so they accept the same syntax as the interactive CLI mode.
         """
         try:
-            expr = sp.sympify(self._normalize_expression(expression))
+            expr = _parse_expression(_normalize_expression(expression))
             if substitutions:
                 # Map textual variables to actual SymPy symbols before applying
                 # replacements, ensuring derived expressions stay symbolic.
-                converted = {sp.symbols(k): self._sympify(v) for k, v in substitutions.items()}
-                expr = expr.subs(converted)
+                converted = {_symbol(k): self._sympify(v) for k, v in substitutions.items()}
+                if expr.has(*_BINDING_CONSTRUCTS) or any(
+                    value.free_symbols for value in converted.values()
+                ):
+                    # Symbolic values may chain (x -> y, y -> 2), and binding
+                    # constructs (integrals, sums, Subs, ...) can use the same
+                    # name both free and bound; both need ``subs`` semantics.
+                    expr = expr.subs(converted)
+                else:
+                    # Plain numeric values only need exact node replacement.
+                    expr = expr.xreplace(converted)
             return sp.simplify(expr)
         except (sp.SympifyError, ValueError, TypeError) as exc:
             raise CalculatorError(str(exc)) from exc
@@ -325,17 +519,10 @@ class AdvancedCalculator:
         if not variable:
             raise CalculatorError("Variable must be provided.")
         try:
-            symbol = sp.symbols(variable)
-            normalized = self._normalize_expression(equation)
-            if "=" in normalized:
-                # Explicit equality: normalise both sides into a SymPy Eq.
-                lhs, rhs = normalized.split("=", maxsplit=1)
-                expr = sp.Eq(sp.sympify(lhs), sp.sympify(rhs))
-            else:
-                # Implicit equality assumes the expression equals zero.
-                expr = sp.Eq(sp.sympify(normalized), 0)
-            result = sp.solveset(expr, symbol, domain=sp.S.Complexes)
-            if isinstance(result, sp.ConditionSet):
+            result = _solve_cached(_normalize_expression(equation), variable)
+            # The ConditionSet check stays outside the cache so the error
+            # path is raised on every call rather than memoized.
+            if isinstance(result, _ConditionSet):
                 # SymPy returns a ConditionSet when no closed-form solution exists.
                 raise CalculatorError(
                     "Analytic solution is unavailable. "
@@ -8,12 +8,16 @@ types, and routing the request to the core calculator object.
 
 from __future__ import annotations
 
+import re
 from typing import Callable, Dict, Tuple
 
 from calculus_core import AdvancedCalculator, CalculatorError
 
 Menu = Dict[str, Tuple[str, Callable[[AdvancedCalculator], None]]]
 
+# One ``key=value`` item of a comma-separated parameter list.
+_KV_RE = re.compile(r"\s*([^=,\s]+)\s*=\s*([^,]+?)\s*(?:,|$)")
+
 
 def prompt(message: str) -> str:
     """Return user input (may be empty).
@@ -25,16 +29,38 @@ def prompt(message: str) -> str:
 
 
 def prompt_required(message: str) -> str:
-    """Request a mandatory value and raise if nothing was provided.
+    """Request a mandatory value, re-prompting until something is provided.
+
+    The function reuses :func:`prompt` to keep the message formatting identical.
+    An empty answer (e.g. a stray Enter press) simply asks again instead of
+    aborting the current operation.
+    """
+    while True:
+        value = prompt(message)
+        if value:
+            return value
+        print("Value cannot be empty, try again.")
 
-    The function reuses :func:`prompt` to keep the message formatting identical
-    and raises a :class:`CalculatorError` so callers share the same error-handling
-    path as core calculator failures.
+
+def parse_key_values(raw: str, label: str) -> Dict[str, str]:
+    """Parse comma-separated ``key=value`` pairs in a single regex pass.
+
+    Any text between matches that is not a pair (e.g. ``radius`` without a
+    value) raises a :class:`CalculatorError` naming it as an invalid ``label``.
     """
-    value = prompt(message)
-    if not value:
-        raise CalculatorError("Value cannot be empty.")
-    return value
+    pairs: Dict[str, str] = {}
+    position = 0
+    for match in _KV_RE.finditer(raw):
+        skipped = raw[position:match.start()].strip(" ,")
+        if skipped:
+            raise CalculatorError(f"Invalid {label}: {skipped}")
+        key, value = match.groups()
+        pairs[key] = value
+        position = match.end()
+    skipped = raw[position:].strip(" ,")
+    if skipped:
+        raise CalculatorError(f"Invalid {label}: {skipped}")
+    return pairs
 
 
 def handle_add(calc: AdvancedCalculator) -> None:
@@ -116,16 +142,7 @@ def handle_geometry(calc: AdvancedCalculator) -> None:
     figure = prompt_required("Operation name: ")
     params_raw = prompt("Parameters (comma separated, e.g. radius=3 or side_a=3,side_b=4,side_c=5): ")
 
-    parameters: Dict[str, str] = {}
-    if params_raw:
-        for item in params_raw.split(","):
-            item = item.strip()
-            if not item:
-                continue
-            if "=" not in item:
-                raise CalculatorError(f"Invalid parameter: {item}")
-            key, value = item.split("=", maxsplit=1)
-            parameters[key.strip()] = value.strip()
+    parameters = parse_key_values(params_raw, "parameter")
 
     result = calc.geometry(figure, **parameters)
     print(f"{result.name}: {result.value}")
@@ -145,16 +162,7 @@ def handle_expression(calc: AdvancedCalculator) -> None:
     expression = prompt_required("Expression: ")
     subs_raw = prompt("Substitutions (format x=1,y=2, optional): ")
 
-    substitutions: Dict[str, str] = {}
-    if subs_raw:
-        for item in subs_raw.split(","):
-            item = item.strip()
-            if not item:
-                continue
-            if "=" not in item:
-                raise CalculatorError(f"Invalid substitution: {item}")
-            key, value = item.split("=", maxsplit=1)
-            substitutions[key.strip()] = value.strip()
+    substitutions = parse_key_values(subs_raw, "substitution")
 
     result = calc.evaluate_expression(expression, substitutions or None)
     print(f"Result: {result}")
@@ -168,35 +176,37 @@ def handle_equation(calc: AdvancedCalculator) -> None:
     print(f"Solutions: {solutions}")
 
 
+_MENU: Menu = {
+    "1": ("Addition", handle_add),
+    "2": ("Subtraction", handle_subtract),
+    "3": ("Multiplication", handle_multiply),
+    "4": ("Division", handle_divide),
+    "5": ("Exponentiation", handle_power),
+    "6": ("Root", handle_root),
+    "7": ("Absolute value", handle_absolute),
+    "8": ("Logarithm", handle_logarithm),
+    "9": ("Quadratic equation", handle_quadratic),
+    "10": ("Geometry helper", handle_geometry),
+    "11": ("Limit", handle_limit),
+    "12": ("Expression mode", handle_expression),
+    "13": ("Equation mode", handle_equation),
+}
+
+
 def get_menu() -> Menu:
-    """Assemble the CLI menu mapping identifiers to handler functions."""
-    return {
-        "1": ("Addition", handle_add),
-        "2": ("Subtraction", handle_subtract),
-        "3": ("Multiplication", handle_multiply),
-        "4": ("Division", handle_divide),
-        "5": ("Exponentiation", handle_power),
-        "6": ("Root", handle_root),
-        "7": ("Absolute value", handle_absolute),
-        "8": ("Logarithm", handle_logarithm),
-        "9": ("Quadratic equation", handle_quadratic),
-        "10": ("Geometry helper", handle_geometry),
-        "11": ("Limit", handle_limit),
-        "12": ("Expression mode", handle_expression),
-        "13": ("Equation mode", handle_equation),
-    }
+    """Return the CLI menu mapping identifiers to handler functions."""
+    return _MENU
 
 
 def main() -> None:
     """Start the interactive loop that powers the command-line interface."""
     calculator = AdvancedCalculator()
-    menu = get_menu()
 
     print("Advanced calculator (press Enter on empty choice to exit).")
 
     while True:
         print("\nChoose an action:")
-        for key, (label, _) in menu.items():
+        for key, (label, _) in _MENU.items():
             # The menu is rendered on every loop iteration to reflect potential
             # future dynamic updates and keep the UX predictable.
             print(f"  {key}. {label}")
@@ -205,7 +215,7 @@ def main() -> None:
             print("Goodbye!")
             break
 
-        action = menu.get(choice)
+        action = _MENU.get(choice)
         if not action:
             print("Unknown command. Try again.")
             continue
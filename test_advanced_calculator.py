@@ -30,6 +30,19 @@ def test_quadratic_solutions_include_complex_roots(calc: AdvancedCalculator) ->
     assert {sp.I, -sp.I} == set(roots)
 
 
+def test_quadratic_irrational_roots_are_exact(calc: AdvancedCalculator) -> None:
+    """Irrational roots come back in exact radical form without simplification."""
+    roots = calc.solve_quadratic(1, 2, -1)
+    assert {-1 + sp.sqrt(2), -1 - sp.sqrt(2)} == set(roots)
+
+
+def test_quadratic_surd_coefficients_cancel_common_factors(calc: AdvancedCalculator) -> None:
+    """Surd coefficients yield roots with the common numeric factor cancelled."""
+    roots = calc.solve_quadratic("sqrt(2)", 2, "sqrt(2)")
+    assert roots == (sp.sqrt(2) * (-1 + sp.I) / 2, sp.sqrt(2) * (-1 - sp.I) / 2)
+    assert str(roots[0]) == "sqrt(2)*(-1 + I)/2"
+
+
 def test_geometry_triangle_area_heronian_triangle(calc: AdvancedCalculator) -> None:
     """Geometry helper must compute the classic 13-14-15 triangle area correctly."""
     geometry_result = calc.geometry("triangle_area", side_a=13, side_b=14, side_c=15)
@@ -49,6 +62,36 @@ def test_limit_high_order_series_at_zero(calc: AdvancedCalculator) -> None:
     assert result == sp.Rational(-1, 6)
 
 
+@pytest.mark.parametrize(
+    ("expression", "direction", "expected"),
+    [
+        ("atan(1/x)", "plus", sp.pi / 2),
+        ("x*log(x)", "plus", 0),
+        ("1/x", "minus", -sp.oo),
+        ("(exp(x**3)-1)/x**3", "plus", 1),
+        ("(1-cos(x**2))/x**4", "plus", sp.Rational(1, 2)),
+        ("(sqrt(1+x**3)-1)/x**3", "plus", sp.Rational(1, 2)),
+        ("log(1+x**3)/x**3", "minus", 1),
+        ("(exp(x**4)-1)/x**4", "plus", 1),
+        ("x/(x+10**-60)", "plus", 0),
+        ("sign(x-10**-40)", "plus", -1),
+    ],
+)
+def test_one_sided_limits_are_exact(
+    calc: AdvancedCalculator, expression: str, direction: str, expected: sp.Expr
+) -> None:
+    """One-sided limits stay exact even where floating-point sampling cancels."""
+    assert calc.limit(expression, "x", 0, direction) == expected
+
+
+def test_one_sided_limit_keeps_float_input_inexact(calc: AdvancedCalculator) -> None:
+    """Float approach points yield the same Float limit in every direction."""
+    for direction in ("both", "plus", "minus"):
+        result = calc.limit("x", "x", 0.5, direction)
+        assert isinstance(result, sp.Float)
+        assert result == sp.Float(0.5)
+
+
 def test_expression_with_nested_substitutions(calc: AdvancedCalculator) -> None:
     """Expression evaluation applies chained substitutions before simplifying."""
     expression = "sin(theta)**2 + cos(theta)**2 + exp(-phi)*phi"
@@ -58,6 +101,15 @@ def test_expression_with_nested_substitutions(calc: AdvancedCalculator) -> None:
     assert sp.simplify(result - expected) == 0
 
 
+def test_substitution_respects_bound_variables(calc: AdvancedCalculator) -> None:
+    """Substituting a bound variable leaves integrals and derivatives well-formed."""
+    assert calc.evaluate_expression("Integral(x*y, (x, 0, 1))", {"x": 2}) == sp.Symbol("y") / 2
+    assert calc.evaluate_expression("Derivative(x**2, x)", {"x": 2}) == 4
+    assert calc.evaluate_expression("Subs(x**2, x, 1) + x", {"x": 5}) == 6
+    assert calc.evaluate_expression("x + Integral(x, (x, 0, 1))", {"x": 2}) == sp.Rational(5, 2)
+    assert calc.evaluate_expression("x*Sum(x, (x, 1, 3))", {"x": 2}) == 12
+
+
 def test_polynomial_equation_all_roots(calc: AdvancedCalculator) -> None:
     """Equation solver should enumerate all roots of a polynomial over the complex numbers."""
     solutions = calc.solve_equation("x**5 - x", "x")
@@ -69,3 +121,61 @@ def test_transcendental_equation_reports_condition_set(calc: AdvancedCalculator)
     """Transcendental equations that lack closed-form solutions raise errors."""
     with pytest.raises(CalculatorError, match="Analytic solution is unavailable"):
         calc.solve_equation("cos(x) = x", "x")
+
+
+def test_unicode_glyphs_are_normalized(calc: AdvancedCalculator) -> None:
+    """Copy/pasted operator glyphs map back to their ASCII counterparts."""
+    result = calc.evaluate_expression("2×3 − √(4) + 2^3 ÷ 4")
+    assert result == 6
+
+
+def test_newlines_in_pasted_input_are_ignored(calc: AdvancedCalculator) -> None:
+    """Multi-line pasted input parses as if it were written on one line."""
+    assert calc.add("x\n+1", 0) == sp.Symbol("x") + 1
+
+
+def test_geometry_surd_inputs_collapse(calc: AdvancedCalculator) -> None:
+    """Products of conjugate surds reduce to their rational value."""
+    area = calc.geometry("rectangle_area", width="sqrt(2)+1", height="sqrt(2)-1")
+    assert area.value == 1
+    perimeter = calc.geometry("rectangle_perimeter", width="sqrt(2)+1", height="sqrt(2)-1")
+    assert perimeter.value == 4 * sp.sqrt(2)
+
+
+def test_geometry_triangle_rejects_degenerate_sides(calc: AdvancedCalculator) -> None:
+    """Triangle helpers share validation and reject sides violating the inequality."""
+    with pytest.raises(CalculatorError, match="Triangle inequality"):
+        calc.geometry("triangle_perimeter", side_a=1, side_b=2, side_c=3)
+
+
+def test_long_flat_sum_parses_to_single_add(calc: AdvancedCalculator) -> None:
+    """Long top-level sums are parsed term by term but match the canonical sum."""
+    expression = " + ".join(f"x{i}" for i in range(200)) + " - 2*x0 + 1e-3"
+    result = calc.evaluate_expression(expression)
+    expected = sp.Add(*sp.symbols("x1:200")) - sp.Symbol("x0") + sp.Float("1e-3")
+    assert result == expected
+
+
+def test_long_sum_keeps_precedence_after_minus(calc: AdvancedCalculator) -> None:
+    """A sign split off a long sum must not move inside tighter operators."""
+    ones = " + ".join(["1"] * 16)
+    assert calc.evaluate_expression(ones + " - 7 % 3") == 15
+    assert calc.evaluate_expression(ones + " - 7 // 2") == 13
+    assert calc.add(" + ".join(["1"] * 15) + " - 7 % 3", 0) == 14
+    assert calc.evaluate_expression(" + ".join(["1"] * 17) + " << 2") == 68
+
+
+def test_long_relational_falls_back_to_whole_parse(calc: AdvancedCalculator) -> None:
+    """Long sums compared with a relational operator still parse as a relational."""
+    expression = " + ".join(f"x{i}" for i in range(20)) + " > 0"
+    result = calc.evaluate_expression(expression)
+    assert isinstance(result, sp.StrictGreaterThan)
+    assert result == sp.simplify(sp.Add(*sp.symbols("x0:20")) > 0)
+
+
+def test_undefined_function_calls_stay_applications(calc: AdvancedCalculator) -> None:
+    """Names followed by parentheses parse as function calls, not products."""
+    f = sp.Function("f")
+    x = sp.Symbol("x")
+    assert calc.evaluate_expression("f(x)", {"x": 1}) == f(1)
+    assert calc.evaluate_expression("f(x) + 2*x0", {"x0": 1}) == f(x) + 2